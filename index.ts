@@ -1,5 +1,9 @@
 import { MCPServer, object, text, widget } from "mcp-use/server";
 import { z } from "zod";
+import { createTtlLru } from "./src/ttl-lru";
+
+const RESEARCH_API_URL = process.env.RESEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
+const SEARCH_API_URL = process.env.SEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
 
 const server = new MCPServer({
   name: "gambling-attics-anonymous",
@@ -184,6 +188,11 @@ interface ResearchResponse {
   synthesis?: string | null;
 }
 
+interface SearchResponse {
+  results: Array<Record<string, unknown>>;
+  expanded_queries: string[];
+}
+
 interface NormalizedMarket {
   id: string;
   title: string;
@@ -315,7 +324,6 @@ function buildResearchRequest(mainEvent: IncomingEvent, relatedEvents: IncomingE
 }
 
 async function runResearch(input: ResearchRequest): Promise<ResearchResponse> {
-  const RESEARCH_API_URL = process.env.RESEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
   const response = await fetch(`${RESEARCH_API_URL}/research`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
@@ -329,6 +337,85 @@ async function runResearch(input: ResearchRequest): Promise<ResearchResponse> {
   return await response.json() as ResearchResponse;
 }
 
+// Search results only change when the backend poller indexes new events
+// (every few minutes), so repeated queries are served from memory.
+const SEARCH_CACHE_TTL_MS = 5 * 60 * 1000;
+const SEARCH_CACHE_MAX_ENTRIES = 256;
+
+const searchCache = createTtlLru<string, SearchResponse>(SEARCH_CACHE_TTL_MS, SEARCH_CACHE_MAX_ENTRIES);
+
+const SEARCH_MAX_ATTEMPTS = 3;
+const SEARCH_RETRY_BASE_DELAY_MS = 300;
+const SEARCH_RETRY_MAX_DELAY_MS = 5_000;
+const SEARCH_TIMEOUT_MS = 10_000;
+
+function isRetryableStatus(status: number): boolean {
+  return status === 429 || status >= 500;
+}
+
+// Retry-After is either delta-seconds or an HTTP date; unparseable values are ignored
+function parseRetryAfter(value: string | null): number {
+  if (!value) return 0;
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? 0 : Math.max(0, date - Date.now());
+}
+
+// Exponential backoff with jitter, capped at SEARCH_RETRY_MAX_DELAY_MS and
+// never shorter than the server's Retry-After
+function retryDelay(attempt: number, minDelayMs = 0): number {
+  const delay = Math.min(SEARCH_RETRY_BASE_DELAY_MS * 2 ** attempt, SEARCH_RETRY_MAX_DELAY_MS);
+  const jittered = Math.min(delay + Math.random() * delay * 0.25, SEARCH_RETRY_MAX_DELAY_MS);
+  return Math.max(jittered, minDelayMs);
+}
+
+type SearchAttempt =
+  | { ok: true; body: unknown }
+  | { ok: false; status: number; statusText: string };
+
+// Timeouts (TimeoutError/AbortError, including while reading the body) and
+// fetch's network TypeError are transient; anything else is thrown at once.
+function isTransientError(err: unknown): boolean {
+  if (!(err instanceof Error)) return false;
+  return err.name === "TimeoutError" || err.name === "AbortError" || err instanceof TypeError;
+}
+
+// Retries 429/5xx responses and transient errors (see isTransientError). The
+// body is read inside the loop so a timeout while streaming it is retried too;
+// a malformed JSON body is not retried and comes back as a null body.
+async function postSearch(body: { query: string; n_results: number }): Promise<SearchAttempt> {
+  for (let attempt = 0; ; attempt++) {
+    const isLastAttempt = attempt + 1 >= SEARCH_MAX_ATTEMPTS;
+    let retryAfterMs = 0;
+    try {
+      const response = await fetch(`${SEARCH_API_URL}/search`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(body),
+        // Aborts the socket on timeout, covering both headers and body
+        signal: AbortSignal.timeout(SEARCH_TIMEOUT_MS),
+      });
+      if (response.ok) {
+        const data = await response.json().catch((err: unknown) => {
+          if (err instanceof SyntaxError) return null;
+          throw err;
+        });
+        return { ok: true, body: data };
+      }
+      await response.body?.cancel();
+      retryAfterMs = parseRetryAfter(response.headers.get("Retry-After"));
+      // A Retry-After beyond the delay cap means the backend won't recover in time
+      if (isLastAttempt || !isRetryableStatus(response.status) || retryAfterMs > SEARCH_RETRY_MAX_DELAY_MS) {
+        return { ok: false, status: response.status, statusText: response.statusText };
+      }
+    } catch (err) {
+      if (isLastAttempt || !isTransientError(err)) throw err;
+    }
+    await new Promise((resolve) => setTimeout(resolve, retryDelay(attempt, retryAfterMs)));
+  }
+}
+
 // ─── New Tools: Event Explorer Flow ────────────────────────────────────────────
 
 server.tool(
@@ -346,27 +433,35 @@ server.tool(
     },
   },
   async ({ query, n_results }) => {
-    const SEARCH_API_URL = process.env.SEARCH_API_URL || "https://executable-easton-bifocal.ngrok-free.dev";
+    // Key on the normalized query so "Bitcoin " and "bitcoin" share an entry;
+    // the original query is still what gets searched and displayed
+    const cacheKey = JSON.stringify([query.trim().toLowerCase(), n_results]);
 
     try {
-      const response = await fetch(`${SEARCH_API_URL}/search`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ query, n_results }),
-      });
-
-      if (!response.ok) {
-        return widget({
-          props: { results: [], expandedQueries: [], query },
-          output: text(`Search API error: ${response.status} ${response.statusText}`),
-        });
+      let data = searchCache.get(cacheKey);
+      if (!data) {
+        const result = await postSearch({ query, n_results });
+
+        if (!result.ok) {
+          return widget({
+            props: { results: [], expandedQueries: [], query },
+            output: text(`Search API error: ${result.status} ${result.statusText}`),
+          });
+        }
+
+        const body = result.body as Partial<SearchResponse> | null;
+        // Only cache well-formed payloads so a bad response isn't replayed for the whole TTL
+        if (!Array.isArray(body?.results) || !Array.isArray(body?.expanded_queries)) {
+          return widget({
+            props: { results: [], expandedQueries: [], query },
+            output: text("Search API returned an unexpected response shape"),
+          });
+        }
+
+        data = body as SearchResponse;
+        searchCache.set(cacheKey, data);
       }
 
-      const data = await response.json() as {
-        results: Array<Record<string, unknown>>;
-        expanded_queries: string[];
-      };
-
       return widget({
         props: {
           results: data.results,
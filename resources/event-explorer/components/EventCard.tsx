@@ -1,5 +1,6 @@
 import React from "react";
 import type { MarketResult } from "../types";
+import { formatVolume, parseNumberList, parseStringList, toNumber } from "../utils";
 
 interface EventCardProps {
   market: MarketResult;
@@ -7,13 +8,6 @@ interface EventCardProps {
   isMain?: boolean;
 }
 
-function formatVolume(value: number): string {
-  if (value >= 1_000_000_000) return `$${(value / 1_000_000_000).toFixed(1)}B`;
-  if (value >= 1_000_000) return `$${(value / 1_000_000).toFixed(0)}M`;
-  if (value >= 1_000) return `$${Math.round(value / 1_000)}K`;
-  return `$${value.toFixed(0)}`;
-}
-
 function parseOutcomes(outcomes?: string | null, prices?: string | null): { name: string; price: number }[] {
   if (!outcomes || !prices) return [];
   const names = parseStringList(outcomes);
@@ -21,48 +15,12 @@ function parseOutcomes(outcomes?: string | null, prices?: string | null): { name
   return names.map((name, i) => ({ name, price: priceVals[i] ?? 0 }));
 }
 
-function parseStringList(value?: string | null): string[] {
-  if (!value) return [];
-  try {
-    const parsed = JSON.parse(value);
-    if (Array.isArray(parsed)) {
-      return parsed.map((item) => String(item).trim()).filter(Boolean);
-    }
-  } catch {
-    // Fall through to CSV parsing
-  }
-  return value.split(",").map((s) => s.trim()).filter(Boolean);
-}
-
-function parseNumberList(value?: string | null): number[] {
-  if (!value) return [];
-  try {
-    const parsed = JSON.parse(value);
-    if (Array.isArray(parsed)) {
-      return parsed.map((item) => Number(item)).filter((num) => Number.isFinite(num));
-    }
-  } catch {
-    // Fall through to CSV parsing
-  }
-  return value
-    .split(",")
-    .map((s) => Number.parseFloat(s.trim()))
-    .filter((num) => Number.isFinite(num));
-}
-
-function toNumber(value: unknown): number | null {
-  if (typeof value === "number" && Number.isFinite(value)) return value;
-  if (typeof value === "string") {
-    const parsed = Number.parseFloat(value);
-    if (Number.isFinite(parsed)) return parsed;
-  }
-  return null;
-}
+const DATE_FORMAT = new Intl.DateTimeFormat("en-US", { month: "short", day: "numeric", year: "numeric" });
 
 function formatDate(dateStr?: string | null): string | null {
   if (!dateStr) return null;
   try {
-    return new Date(dateStr).toLocaleDateString("en-US", { month: "short", day: "numeric", year: "numeric" });
+    return DATE_FORMAT.format(new Date(dateStr));
   } catch {
     return null;
   }
@@ -70,9 +28,11 @@ function formatDate(dateStr?: string | null): string | null {
 
 export const EventCard: React.FC<EventCardProps> = ({ market, onAnalyze, isMain = false }) => {
   const primaryMarket = market.markets?.[0];
-  const parsed = parseOutcomes(
-    market.outcomes ?? primaryMarket?.outcomes,
-    market.outcomePrices ?? primaryMarket?.outcomePrices
+  const outcomes = market.outcomes ?? primaryMarket?.outcomes;
+  const outcomePrices = market.outcomePrices ?? primaryMarket?.outcomePrices;
+  const parsed = React.useMemo(
+    () => parseOutcomes(outcomes, outcomePrices),
+    [outcomes, outcomePrices]
   );
   const endDateStr = formatDate(market.endDate ?? primaryMarket?.endDate);
   const title = market.title || market.question || "Untitled Event";
@@ -1,14 +1,6 @@
 import React from "react";
-import type { MarketSignal, MarketWithAction } from "../types";
-
-const MIN_ORDER_SHARES = 5;
-
-type OrderSide = "BUY" | "SELL";
-
-type OrderFeedback = {
-  kind: "success" | "error";
-  message: string;
-};
+import type { ConfidenceLevel, MarketSignal, MarketWithAction, OrderFeedback, OrderSide } from "../types";
+import { formatVolume, MIN_ORDER_SHARES } from "../utils";
 
 interface MarketAnalysisCardProps {
   market: MarketWithAction;
@@ -25,19 +17,11 @@ interface MarketAnalysisCardProps {
   orderFeedback?: OrderFeedback;
 }
 
-function formatVolume(value: number): string {
-  if (value >= 1_000_000_000) return `$${(value / 1_000_000_000).toFixed(1)}B`;
-  if (value >= 1_000_000) return `$${(value / 1_000_000).toFixed(0)}M`;
-  if (value >= 1_000) return `$${Math.round(value / 1_000)}K`;
-  return `$${value.toFixed(0)}`;
-}
-
-function formatSignalLabel(value: string): string {
-  return value
-    .split("_")
-    .map((part) => part.charAt(0).toUpperCase() + part.slice(1))
-    .join(" ");
-}
+const CONFIDENCE_LABELS: Record<ConfidenceLevel, string> = {
+  high: "High",
+  medium: "Medium",
+  low: "Low",
+};
 
 export const MarketAnalysisCard: React.FC<MarketAnalysisCardProps> = ({
   market,
@@ -85,7 +69,7 @@ export const MarketAnalysisCard: React.FC<MarketAnalysisCardProps> = ({
               Prediction: {signal.prediction.toUpperCase()}
             </span>
             <span className="category-badge">
-              Confidence: {formatSignalLabel(signal.confidence)}
+              Confidence: {CONFIDENCE_LABELS[signal.confidence]}
             </span>
           </div>
           <p className="text-xs text-secondary leading-relaxed whitespace-pre-wrap">
@@ -194,6 +194,13 @@ export const riskAnalysisOutputSchema = z.object({
   disclaimer: z.string(),
 });
 
+export type OrderSide = "BUY" | "SELL";
+
+export type OrderFeedback = {
+  kind: "success" | "error";
+  message: string;
+};
+
 export type MarketResult = z.infer<typeof marketResultSchema>;
 export type EventExplorerProps = z.infer<typeof propsSchema>;
 export type EventInfo = z.infer<typeof eventInfoSchema>;
@@ -207,5 +214,6 @@ export type SubEventRelationship = z.infer<typeof subEventRelationshipSchema>;
 export type ResearchOutput = z.infer<typeof researchOutputSchema>;
 export type ResearchInput = z.infer<typeof researchInputSchema>;
 export type RiskManagementInput = z.infer<typeof riskManagementInputSchema>;
+export type ConfidenceLevel = z.infer<typeof confidenceLevelSchema>;
 export type MarketSignal = z.infer<typeof marketSignalSchema>;
 export type RiskAnalysisOutput = z.infer<typeof riskAnalysisOutputSchema>;
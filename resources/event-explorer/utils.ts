@@ -0,0 +1,54 @@
+export const MIN_ORDER_SHARES = 5;
+
+export function toNumber(value: unknown): number | null {
+  if (typeof value === "number" && Number.isFinite(value)) return value;
+  if (typeof value === "string") {
+    const parsed = Number.parseFloat(value);
+    if (Number.isFinite(parsed)) return parsed;
+  }
+  return null;
+}
+
+function toTrimmedStrings(items: readonly unknown[]): string[] {
+  const result: string[] = [];
+  for (const item of items) {
+    const trimmed = String(item).trim();
+    if (trimmed) result.push(trimmed);
+  }
+  return result;
+}
+
+export function parseStringList(value?: string | null): string[] {
+  if (!value) return [];
+  try {
+    const parsed = JSON.parse(value);
+    if (Array.isArray(parsed)) {
+      return toTrimmedStrings(parsed);
+    }
+  } catch {
+    // Fall through to CSV parsing
+  }
+  return toTrimmedStrings(value.split(","));
+}
+
+// Keeps one slot per entry (null when missing or invalid) so prices stay
+// aligned by index with the outcome names they belong to.
+export function parseNumberList(value?: string | null): (number | null)[] {
+  if (!value) return [];
+  try {
+    const parsed = JSON.parse(value);
+    if (Array.isArray(parsed)) {
+      return parsed.map(toNumber);
+    }
+  } catch {
+    // Fall through to CSV parsing
+  }
+  return value.split(",").map(toNumber);
+}
+
+export function formatVolume(value: number): string {
+  if (value >= 1_000_000_000) return `$${(value / 1_000_000_000).toFixed(1)}B`;
+  if (value >= 1_000_000) return `$${(value / 1_000_000).toFixed(0)}M`;
+  if (value >= 1_000) return `$${Math.round(value / 1_000)}K`;
+  return `$${value.toFixed(0)}`;
+}
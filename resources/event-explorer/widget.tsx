@@ -1,5 +1,6 @@
 import { McpUseProvider, useWidget, type WidgetMetadata } from "mcp-use/react";
 import React from "react";
+import { createTtlLru } from "../../src/ttl-lru";
 import "../styles.css";
 import { EventCard } from "./components/EventCard";
 import { EventExplorerSkeleton } from "./components/EventExplorerSkeleton";
@@ -9,6 +10,8 @@ import type {
   EventExplorerProps,
   MarketResult,
   NewsLink,
+  OrderFeedback,
+  OrderSide,
   ResearchInput,
   ResearchOutput,
   RiskAnalysisOutput,
@@ -22,6 +25,7 @@ import {
   riskAnalysisOutputSchema,
   riskManagementInputSchema,
 } from "./types";
+import { MIN_ORDER_SHARES, parseNumberList, parseStringList, toNumber } from "./utils";
 
 export const widgetMetadata: WidgetMetadata = {
   description: "Search and display prediction market results from the search API",
@@ -41,49 +45,12 @@ const RESEARCH_API_URL =
   "https://executable-easton-bifocal.ngrok-free.dev";
 const API_BASE_URL = RESEARCH_API_URL.replace(/\/$/, "");
 
-type OrderSide = "BUY" | "SELL";
-
 type OrderRequest = {
   token_id: string;
   amount: number;
   side: OrderSide;
 };
 
-type OrderFeedback = {
-  kind: "success" | "error";
-  message: string;
-};
-
-const MIN_ORDER_SHARES = 5;
-
-function toNumber(value: unknown): number {
-  if (typeof value === "number" && Number.isFinite(value)) return value;
-  if (typeof value === "string") {
-    const parsed = Number.parseFloat(value);
-    if (Number.isFinite(parsed)) return parsed;
-  }
-  return 0;
-}
-
-function parseStringList(value?: string | null): string[] {
-  if (!value) return [];
-  try {
-    const parsed = JSON.parse(value);
-    if (Array.isArray(parsed)) {
-      return parsed.map((item) => String(item).trim()).filter(Boolean);
-    }
-  } catch {
-    // Fall through to CSV parsing
-  }
-  return value.split(",").map((item) => item.trim()).filter(Boolean);
-}
-
-function parseNumberList(value?: string | null): number[] {
-  return parseStringList(value)
-    .map((item) => Number.parseFloat(item))
-    .filter((num) => Number.isFinite(num));
-}
-
 function parseOutcomes(
   outcomes?: string | null,
   outcomePrices?: string | null
@@ -105,11 +72,9 @@ function parseOutcomes(
 function inferCurrentPrice(outcomes?: string | null, outcomePrices?: string | null): number | undefined {
   const names = parseStringList(outcomes).map((name) => name.toLowerCase());
   const prices = parseNumberList(outcomePrices);
-  if (prices.length === 0) return undefined;
-
   const yesIndex = names.findIndex((name) => name === "yes");
-  const candidate = yesIndex >= 0 && prices[yesIndex] != null ? prices[yesIndex] : prices[0];
-  if (!Number.isFinite(candidate) || candidate < 0 || candidate > 1) return undefined;
+  const candidate = (yesIndex >= 0 ? prices[yesIndex] : null) ?? prices.find((price) => price != null);
+  if (candidate == null || candidate < 0 || candidate > 1) return undefined;
   return candidate;
 }
 
@@ -163,8 +128,8 @@ function buildFallbackAnalysis(selectedEvent: MarketResult): AnalysisResult {
     title: market.title ?? market.question ?? `Market ${index + 1}`,
     slug: market.slug ?? market.id ?? `${selectedEvent.id}-market-${index + 1}`,
     category: market.category ?? selectedEvent.category ?? "General",
-    volume: toNumber(market.volume),
-    liquidity: toNumber(market.liquidity),
+    volume: toNumber(market.volume) ?? 0,
+    liquidity: toNumber(market.liquidity) ?? 0,
     endDate: market.endDate ?? new Date().toISOString(),
     outcomes: parseOutcomes(market.outcomes, market.outcomePrices),
     clobTokenIds: parseClobTokenIds(market.clobTokenIds),
@@ -183,7 +148,7 @@ function buildFallbackAnalysis(selectedEvent: MarketResult): AnalysisResult {
       description: selectedEvent.description ?? "No event description available.",
       slug: selectedEvent.slug ?? selectedEvent.id,
       category: selectedEvent.category ?? "General",
-      volume: toNumber(selectedEvent.volumeNum ?? selectedEvent.volume),
+      volume: toNumber(selectedEvent.volumeNum ?? selectedEvent.volume) ?? 0,
     },
     markets: fallbackMarkets,
   };
@@ -227,44 +192,121 @@ function buildRiskInput(
   };
 }
 
-async function runResearch(input: ResearchInput): Promise<ResearchOutput> {
-  const requestBody = researchInputSchema.parse(input);
-  const response = await fetch(`${API_BASE_URL}/research`, {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(requestBody),
-  });
+// Research takes minutes (web search + synthesis), so re-analyzing an event
+// shortly afterwards reuses the previous result instead of re-running the
+// whole pipeline. The TTL is kept short so a later Analyze picks up fresh
+// news, and the entry cap bounds memory since each response can be large.
+const RESEARCH_CACHE_TTL_MS = 10 * 60 * 1000;
+const RESEARCH_CACHE_MAX_ENTRIES = 8;
+
+const researchCache = createTtlLru<string, ResearchOutput>(RESEARCH_CACHE_TTL_MS, RESEARCH_CACHE_MAX_ENTRIES);
+
+// Analyses of the same event that overlap (e.g. re-opening it before the
+// first run finished) share one request instead of hitting the backend twice.
+// The shared request is bound to the first caller's signal, so aborting it
+// rejects every joiner too; the entry is then dropped and the next call
+// starts a fresh request.
+const inFlightResearch = new Map<string, Promise<ResearchOutput>>();
+const inFlightRisk = new Map<string, Promise<RiskAnalysisOutput>>();
+
+function shareInFlight<T>(requests: Map<string, Promise<T>>, key: string, start: () => Promise<T>): Promise<T> {
+  const pending = requests.get(key);
+  if (pending) return pending;
+  const request = start().finally(() => requests.delete(key));
+  requests.set(key, request);
+  return request;
+}
 
-  if (!response.ok) {
-    throw new Error(`Research API error: ${response.status} ${response.statusText}`);
-  }
+// Superseded analyses keep running in the background, so distinct research
+// runs are capped; extra runs wait in FIFO order for a free slot.
+const MAX_CONCURRENT_RESEARCH = 2;
+
+let activeResearchCount = 0;
+const researchQueue: Array<() => void> = [];
 
-  const raw = await response.json();
-  const parsed = researchOutputSchema.safeParse(raw);
-  if (!parsed.success) {
-    throw new Error(`Research response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+function acquireResearchSlot(signal?: AbortSignal): Promise<void> {
+  signal?.throwIfAborted();
+  if (activeResearchCount < MAX_CONCURRENT_RESEARCH) {
+    activeResearchCount += 1;
+    return Promise.resolve();
   }
-  return parsed.data;
+  return new Promise((resolve, reject) => {
+    const grant = () => {
+      signal?.removeEventListener("abort", onAbort);
+      resolve();
+    };
+    const onAbort = () => {
+      const index = researchQueue.indexOf(grant);
+      if (index >= 0) researchQueue.splice(index, 1);
+      reject(signal?.reason);
+    };
+    researchQueue.push(grant);
+    signal?.addEventListener("abort", onAbort, { once: true });
+  });
 }
 
-async function runRiskAnalysis(input: RiskManagementInput): Promise<RiskAnalysisOutput> {
-  const requestBody = riskManagementInputSchema.parse(input);
-  const response = await fetch(`${API_BASE_URL}/risk`, {
-    method: "POST",
-    headers: { "Content-Type": "application/json" },
-    body: JSON.stringify(requestBody),
+function releaseResearchSlot(): void {
+  // Hand the slot straight to the next waiter instead of freeing it
+  const next = researchQueue.shift();
+  if (next) next();
+  else activeResearchCount -= 1;
+}
+
+async function runResearch(input: ResearchInput, signal?: AbortSignal): Promise<ResearchOutput> {
+  const requestBody = researchInputSchema.parse(input);
+  const cacheKey = JSON.stringify(requestBody);
+  const cached = researchCache.get(cacheKey);
+  if (cached) return cached;
+
+  return shareInFlight(inFlightResearch, cacheKey, async () => {
+    await acquireResearchSlot(signal);
+    try {
+      const response = await fetch(`${API_BASE_URL}/research`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(requestBody),
+        signal,
+      });
+
+      if (!response.ok) {
+        throw new Error(`Research API error: ${response.status} ${response.statusText}`);
+      }
+
+      const raw = await response.json();
+      const parsed = researchOutputSchema.safeParse(raw);
+      if (!parsed.success) {
+        throw new Error(`Research response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+      }
+      researchCache.set(cacheKey, parsed.data);
+      return parsed.data;
+    } finally {
+      releaseResearchSlot();
+    }
   });
+}
 
-  if (!response.ok) {
-    throw new Error(`Risk API error: ${response.status} ${response.statusText}`);
-  }
+async function runRiskAnalysis(input: RiskManagementInput, signal?: AbortSignal): Promise<RiskAnalysisOutput> {
+  const requestBody = riskManagementInputSchema.parse(input);
 
-  const raw = await response.json();
-  const parsed = riskAnalysisOutputSchema.safeParse(raw);
-  if (!parsed.success) {
-    throw new Error(`Risk response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
-  }
-  return parsed.data;
+  return shareInFlight(inFlightRisk, JSON.stringify(requestBody), async () => {
+    const response = await fetch(`${API_BASE_URL}/risk`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(requestBody),
+      signal,
+    });
+
+    if (!response.ok) {
+      throw new Error(`Risk API error: ${response.status} ${response.statusText}`);
+    }
+
+    const raw = await response.json();
+    const parsed = riskAnalysisOutputSchema.safeParse(raw);
+    if (!parsed.success) {
+      throw new Error(`Risk response schema mismatch: ${parsed.error.issues[0]?.message ?? "invalid payload"}`);
+    }
+    return parsed.data;
+  });
 }
 
 async function placeOrder(request: OrderRequest): Promise<unknown> {
@@ -294,11 +336,16 @@ async function placeOrder(request: OrderRequest): Promise<unknown> {
   }
 }
 
+const SENTIMENT_LABELS: Record<SentimentRating, string> = {
+  very_bearish: "Very Bearish",
+  bearish: "Bearish",
+  neutral: "Neutral",
+  bullish: "Bullish",
+  very_bullish: "Very Bullish",
+};
+
 function formatSentiment(sentiment: SentimentRating): string {
-  return sentiment
-    .split("_")
-    .map((part) => part.charAt(0).toUpperCase() + part.slice(1))
-    .join(" ");
+  return SENTIMENT_LABELS[sentiment];
 }
 
 function formatTimestamp(value?: string): string {
@@ -308,18 +355,23 @@ function formatTimestamp(value?: string): string {
   return parsed.toLocaleString();
 }
 
-function mergeNewsLinks(research: ResearchOutput): NewsLink[] {
-  const links: NewsLink[] = [
-    ...(research.main_event_research?.news_links ?? []),
-    ...research.sub_event_research.flatMap((item) => item.news_links ?? []),
+const MAX_NEWS_LINKS = 6;
+
+function mergeNewsLinks(research: ResearchOutput, limit: number): NewsLink[] {
+  const sources: NewsLink[][] = [
+    research.main_event_research?.news_links ?? [],
+    ...research.sub_event_research.map((item) => item.news_links ?? []),
   ];
 
   const seen = new Set<string>();
   const deduped: NewsLink[] = [];
-  for (const link of links) {
-    if (!link.url || seen.has(link.url)) continue;
-    seen.add(link.url);
-    deduped.push(link);
+  for (const links of sources) {
+    for (const link of links) {
+      if (!link.url || seen.has(link.url)) continue;
+      seen.add(link.url);
+      deduped.push(link);
+      if (deduped.length >= limit) return deduped;
+    }
   }
   return deduped;
 }
@@ -386,11 +438,23 @@ const EventExplorer: React.FC = () => {
   const [orderFeedbackByMarket, setOrderFeedbackByMarket] = React.useState<
     Record<string, OrderFeedback>
   >({});
-  const riskSignalsByMarketId = new Map(
-    (riskAnalysis?.signals ?? []).map((signal) => [signal.market_id, signal])
+  const riskSignalsByMarketId = React.useMemo(
+    () => new Map((riskAnalysis?.signals ?? []).map((signal) => [signal.market_id, signal])),
+    [riskAnalysis]
   );
 
+  // Switching events lets earlier runs finish in the background (bounded by
+  // MAX_CONCURRENT_RESEARCH) so their research still lands in the cache; the
+  // run id keeps a superseded run from overwriting the newer event's state.
+  // Requests are only aborted when the search results change or the widget
+  // unmounts.
+  const analysisRunRef = React.useRef(0);
+  const analysisAbortRef = React.useRef<AbortController | null>(null);
+
   React.useEffect(() => {
+    const controller = new AbortController();
+    analysisAbortRef.current = controller;
+    analysisRunRef.current += 1;
     setAnalysis(null);
     setResearch(null);
     setRiskAnalysis(null);
@@ -400,6 +464,7 @@ const EventExplorer: React.FC = () => {
     setRiskError(null);
     setActiveOrderKey(null);
     setOrderFeedbackByMarket({});
+    return () => controller.abort();
   }, [props.query, props.results]);
 
   if (isPending) {
@@ -421,6 +486,10 @@ const EventExplorer: React.FC = () => {
   const { results, expandedQueries, query } = props;
 
   const handleAnalyze = async (selectedEvent: MarketResult) => {
+    const runId = ++analysisRunRef.current;
+    const isSuperseded = () => analysisRunRef.current !== runId;
+    const signal = analysisAbortRef.current?.signal;
+
     setIsAnalyzing(true);
     setResearchError(null);
     setRiskError(null);
@@ -433,20 +502,24 @@ const EventExplorer: React.FC = () => {
     setAnalysis(fallbackAnalysis);
 
     try {
-      const response = await runResearch(researchInput);
+      const response = await runResearch(researchInput, signal);
+      if (isSuperseded()) return;
       setResearch(response);
 
       setIsRiskLoading(true);
       try {
         const riskInput = buildRiskInput(selectedEvent, response);
-        const riskResponse = await runRiskAnalysis(riskInput);
+        const riskResponse = await runRiskAnalysis(riskInput, signal);
+        if (isSuperseded()) return;
         setRiskAnalysis(riskResponse);
       } catch (error) {
+        if (isSuperseded()) return;
         setRiskError(error instanceof Error ? error.message : String(error));
       } finally {
-        setIsRiskLoading(false);
+        if (!isSuperseded()) setIsRiskLoading(false);
       }
     } catch (error) {
+      if (isSuperseded()) return;
       setResearchError(error instanceof Error ? error.message : String(error));
     }
 
@@ -525,7 +598,7 @@ const EventExplorer: React.FC = () => {
   const isResearchReady = research !== null;
   const isResearchLoading = isAnalyzing && !isResearchReady && !researchError;
   const isRiskPending = isResearchReady && isRiskLoading && !riskAnalysis;
-  const combinedNewsLinks = research ? mergeNewsLinks(research) : [];
+  const combinedNewsLinks = research ? mergeNewsLinks(research, MAX_NEWS_LINKS) : [];
   const mainEventResearch = research?.main_event_research ?? null;
 
   return (
@@ -539,7 +612,9 @@ const EventExplorer: React.FC = () => {
                 <button
                   className="analyze-button"
                   onClick={() => {
+                    analysisRunRef.current += 1;
                     setAnalysis(null);
+                    setIsAnalyzing(false);
                     setResearch(null);
                     setRiskAnalysis(null);
                     setResearchError(null);
@@ -662,7 +737,7 @@ const EventExplorer: React.FC = () => {
                           News Sources
                         </h4>
                         <div className="space-y-2">
-                          {combinedNewsLinks.slice(0, 6).map((link) => (
+                          {combinedNewsLinks.map((link) => (
                             <a
                               key={link.url}
                               href={link.url}
@@ -24,17 +24,18 @@ const LEVEL_STYLES: Record<LogEntry["level"], { bg: string; text: string; border
   error:  { bg: "rgba(239,68,68,0.08)", text: "#ef4444", border: "#dc2626", label: "ERROR" },
 };
 
+const TIMESTAMP_FORMAT = new Intl.DateTimeFormat("en-US", {
+  month: "short",
+  day: "numeric",
+  hour: "2-digit",
+  minute: "2-digit",
+  second: "2-digit",
+  hour12: false,
+});
+
 function formatTimestamp(iso: string): string {
   try {
-    const d = new Date(iso);
-    return d.toLocaleString("en-US", {
-      month: "short",
-      day: "numeric",
-      hour: "2-digit",
-      minute: "2-digit",
-      second: "2-digit",
-      hour12: false,
-    });
+    return TIMESTAMP_FORMAT.format(new Date(iso));
   } catch {
     return iso;
   }
@@ -93,7 +94,10 @@ const MonitoringLogs: React.FC = () => {
   const monitorCount = Object.keys(activeMonitors).length;
 
   const filtered = filter === "all" ? logs : logs.filter((l) => l.level === filter);
-  const sorted = [...filtered].sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
+  const sorted = filtered
+    .map((entry) => ({ entry, time: Date.parse(entry.timestamp) }))
+    .sort((a, b) => b.time - a.time)
+    .map(({ entry }) => entry);
 
   const filterButtons: { key: LevelFilter; label: string }[] = [
     { key: "all", label: "All" },
@@ -0,0 +1,30 @@
+export interface TtlLru<K, V> {
+  get(key: K): V | null;
+  set(key: K, value: V): void;
+}
+
+// Map-backed cache whose entries expire after ttlMs; once maxEntries is
+// exceeded the least recently used entry is evicted.
+export function createTtlLru<K, V>(ttlMs: number, maxEntries: number): TtlLru<K, V> {
+  const entries = new Map<K, { expiresAt: number; value: V }>();
+
+  return {
+    get(key) {
+      const entry = entries.get(key);
+      if (!entry) return null;
+      entries.delete(key);
+      if (entry.expiresAt <= Date.now()) return null;
+      // Re-insert so Map iteration order tracks recency for eviction
+      entries.set(key, entry);
+      return entry.value;
+    },
+    set(key, value) {
+      entries.delete(key);
+      entries.set(key, { expiresAt: Date.now() + ttlMs, value });
+      if (entries.size > maxEntries) {
+        const oldestKey = entries.keys().next().value;
+        if (oldestKey !== undefined) entries.delete(oldestKey);
+      }
+    },
+  };
+}